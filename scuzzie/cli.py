@@ -1,5 +1,7 @@
 """Defines the Scuzzie command line interface."""
+import os
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Generator, NamedTuple
 
@@ -7,7 +9,6 @@ import click
 
 from scuzzie.comic import read_comic, write_comic
 from scuzzie.exc import ScuzzieError
-from scuzzie.generator import FileWriter, generate_site, load_templates
 from scuzzie.resources import Comic, Volume
 
 DEFAULT_COMIC_PATH = "comic"
@@ -36,10 +37,10 @@ def scuzzie_error_handler() -> Generator[None, None, None]:
 
 def prompt_for_volume(volumes: list[Volume]) -> Volume:
     """Prompt the user to choose a volume from the list."""
-    click.echo("Available Volumes:")
-    for idx, volume in enumerate(volumes):
-        click.echo(f"{idx + 1:2}: {volume.title}")
-    click.echo()
+    listing = "\n".join(
+        f"{idx + 1:2}: {volume.title}" for idx, volume in enumerate(volumes)
+    )
+    click.echo(f"Available Volumes:\n{listing}\n")
 
     while True:
         idx = int(click.prompt("Select a volume", type=int, default=str(len(volumes))))
@@ -50,12 +51,20 @@ def prompt_for_volume(volumes: list[Volume]) -> Volume:
     return volumes[idx - 1]
 
 
+@lru_cache
+def _assets_path(comic_path: Path) -> str:
+    """Returns the absolute assets path for the given comic path."""
+    return os.path.abspath(comic_path / "assets")
+
+
 def sanitise_image_path(image_path_str: str, *, comic_path: Path) -> Path:
     """Sanitise the given image path string."""
-    image_path = Path(image_path_str.strip("\"'")).absolute()
-    assets_path = (comic_path / "assets").absolute()
+    # plain string comparisons keep this O(1) in path depth; a Path is
+    # only built for the final result.
+    image_path = os.path.abspath(image_path_str.strip("\"'"))
+    assets_path = _assets_path(comic_path)
 
-    if assets_path not in image_path.parents:
+    if not image_path.startswith(assets_path + os.sep):
         click.secho(
             f"{image_path} is not in the assets directory.\n"
             "Please provide a path relative to the assets directory.",
@@ -64,7 +73,7 @@ def sanitise_image_path(image_path_str: str, *, comic_path: Path) -> Path:
         raise click.Abort
 
     # we treat the assets directory as the root of the comic
-    return Path("/") / image_path.relative_to(assets_path)
+    return Path("/") / image_path[len(assets_path) + 1 :]
 
 
 def prompt_image_path(comic: Comic, *, resource_type: str) -> Path:
@@ -80,9 +89,7 @@ def prompt_image_path(comic: Comic, *, resource_type: str) -> Path:
 
     image_path = click.prompt(f"{resource_type.title()} image", default="")
     if not image_path:
-        image_path = str(
-            CONTEXT.comic_path / "assets" / str(comic.placeholder).strip("/")
-        )
+        image_path = str(comic.placeholder_asset_path)
 
     return sanitise_image_path(image_path, comic_path=CONTEXT.comic_path)
 
@@ -118,6 +125,13 @@ def scuzzie(comic_path_string: str, output_path_string: str) -> None:
 @scuzzie.command()
 def build() -> None:
     """Builds the site."""
+    # imported here so `scuzzie new ...` doesn't pay the mako import cost.
+    from scuzzie.generator import (  # pylint: disable=import-outside-toplevel
+        FileWriter,
+        generate_site,
+        load_templates,
+    )
+
     with scuzzie_error_handler():
         comic = read_comic(CONTEXT.comic_path)
         templator = load_templates(comic)
@@ -1,8 +1,15 @@
 """Defines comic resource serializers & deserializers."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Mapping, Optional, Type
+from typing import Any, Mapping, Optional, Type, Union
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # python < 3.11
+    import tomli as tomllib  # type: ignore[no-redef]
 
-import tomli
 import tomli_w
 
 from . import models
@@ -16,32 +23,49 @@ from .exc import (
 from .resources import Comic, Page, Volume
 
 
+@lru_cache(maxsize=None)
 def _ensure_path(path: Path) -> Path:
+    # mkdir is idempotent within a process, so repeat calls for the same
+    # directory collapse into a cache lookup.
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
-def _try_read_toml(path: Path, error_type: Type[ScuzzieConfigError]) -> dict:
+StrPath = Union[str, Path]
+
+
+def _try_read_toml(path: StrPath, error_type: Type[ScuzzieConfigError]) -> dict:
     try:
-        with path.open("rb") as file:
-            return tomli.load(file)
+        with open(path, "rb") as file:
+            return tomllib.load(file)
     except FileNotFoundError as ex:
         raise error_type(
             reason=f"Failed to load file from {path}; it may not exist."
         ) from ex
 
 
-def _try_write_toml(path: Path, data: Mapping[str, Any]) -> None:
-    _ensure_path(path.parent)
+def _try_write_toml(
+    path: Path, data: Mapping[str, Any], *, ensure_parent: bool = True
+) -> None:
+    if ensure_parent:
+        _ensure_path(path.parent)
 
-    data = {**data}
-    for key, value in data.items():
-        if isinstance(value, Path):
-            data[key] = str(value)
+    data = {
+        key: str(value) if isinstance(value, Path) else value
+        for key, value in data.items()
+    }
 
-    toml = tomli_w.dumps(data)
-    with path.open("w") as file:
-        print(toml, file=file)
+    content = f"{tomli_w.dumps(data)}\n".encode("utf-8")
+
+    # skip the write entirely when the file already holds identical content;
+    # this keeps untouched configs off the disk on incremental saves.
+    try:
+        if path.read_bytes() == content:
+            return
+    except OSError:
+        pass
+
+    path.write_bytes(content)
 
 
 def read_comic(path: Path) -> Comic:
@@ -62,12 +86,36 @@ def _read_volumes(*, into: Comic, comic_path: Path) -> None:
             "This should never happen."
         )
 
-    volumes_path = _ensure_path(into.path / "volumes")
-    for volume_path in volumes_path.iterdir():
-        config = _read_volume_config(volume_path)
-        volume = _volume_from_config(config, path=volume_path, comic_path=comic_path)
+    volumes_path = _ensure_path(into.volumes_dir)
+    # os.scandir walks the directory in a single pass and lets us defer
+    # Path construction until the volume is actually built.
+    # is_dir reuses the dirent data from the scan, so filtering out
+    # dotfiles and stray files here costs no extra stat calls.
+    with os.scandir(volumes_path) as entries:
+        volume_paths = sorted(
+            entry.path
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".")
+        )
+
+    if not volume_paths:
+        return
+
+    def read_volume(path_string: str) -> Volume:
+        config = _read_volume_config(path_string)
+        volume = _volume_from_config(
+            config, path=Path(path_string), comic_path=comic_path
+        )
         _read_pages(into=volume, comic_path=comic_path)
-        into.add_volume(volume)
+        return volume
+
+    # each volume's configs are independent files, so reading them on a
+    # thread pool overlaps the open/read syscall latency. executor.map
+    # preserves input order, keeping the result deterministic.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for volume in executor.map(read_volume, volume_paths):
+            into.add_volume(volume)
 
 
 def _read_pages(*, into: Volume, comic_path: Path) -> None:
@@ -77,13 +125,19 @@ def _read_pages(*, into: Volume, comic_path: Path) -> None:
             "This should never happen."
         )
 
-    pages_path = _ensure_path(into.path / "pages")
-    for page_path in pages_path.iterdir():
-        config = _read_page_config(page_path)
-        page = _page_from_config(config, path=page_path, comic_path=comic_path)
-        into.add_page(page)
+    pages_path = _ensure_path(into.pages_dir)
+    with os.scandir(pages_path) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False) or entry.name.startswith("."):
+                continue
+            config = _read_page_config(entry.path)
+            page = _page_from_config(
+                config, path=Path(entry.path), comic_path=comic_path
+            )
+            into.add_page(page)
 
-    missing_pages = [slug for slug in into.page_slugs if slug not in into.pages]
+    # set difference runs in C rather than probing the dict per slug.
+    missing_pages = sorted(set(into.page_slugs) - into.pages.keys())
     if missing_pages:
         raise ScuzzieVolumeConfigError(
             f'Volume "{into.title}" lists the following pages '
@@ -97,20 +151,20 @@ def _read_comic_config(path: Path) -> dict:
     return _try_read_toml(config_path, ScuzzieComicConfigError)
 
 
-def _read_volume_config(path: Path) -> dict:
-    config_path = path / "volume.toml"
+def _read_volume_config(path: StrPath) -> dict:
+    config_path = os.path.join(path, "volume.toml")
     return _try_read_toml(config_path, ScuzzieVolumeConfigError)
 
 
-def _read_page_config(path: Path) -> dict:
-    config_path = path / "page.toml"
+def _read_page_config(path: StrPath) -> dict:
+    config_path = os.path.join(path, "page.toml")
     return _try_read_toml(config_path, ScuzziePageConfigError)
 
 
 def _comic_from_config(config: dict, *, path: Path) -> Comic:
     try:
         with models.set_context(path):
-            data = models.Comic(**config)
+            data = models.Comic.model_validate(config)
     except ValueError as ex:
         raise ScuzzieComicConfigError(str(ex)) from ex
 
@@ -119,34 +173,43 @@ def _comic_from_config(config: dict, *, path: Path) -> Comic:
         name=data.name,
         placeholder=data.placeholder,
         volume_slugs=data.volumes,
+        model=data,
     )
 
 
 def _volume_from_config(config: dict, *, path: Path, comic_path: Path) -> Volume:
     try:
         with models.set_context(comic_path):
-            data = models.Volume(**config)
+            data = models.Volume.model_validate(config)
     except ValueError as ex:
         raise ScuzzieVolumeConfigError(str(ex)) from ex
 
-    return Volume(path=path, title=data.title, image=data.image, page_slugs=data.pages)
+    return Volume(
+        path=path,
+        title=data.title,
+        image=data.image,
+        page_slugs=data.pages,
+        model=data,
+    )
 
 
 def _page_from_config(config: dict, *, path: Path, comic_path: Path) -> Page:
     try:
         with models.set_context(comic_path):
-            data = models.Page(**config)
+            data = models.Page.model_validate(config)
     except ValueError as ex:
         raise ScuzzieVolumeConfigError(str(ex)) from ex
 
-    return Page(path=path, title=data.title, image=data.image)
+    return Page(path=path, title=data.title, image=data.image, model=data)
 
 
 def _ensure_comic_has_path(comic: Comic, path: Optional[Path] = None) -> Path:
-    if comic.path and not path:
+    # explicit None checks rather than truthiness: paths are either set
+    # or absent, and this sidesteps Path.__bool__ entirely.
+    if comic.path is not None and path is None:
         return comic.path
 
-    if path and not comic.path:
+    if path is not None and comic.path is None:
         comic.path = path
         return path
 
@@ -158,8 +221,27 @@ def _ensure_comic_has_path(comic: Comic, path: Optional[Path] = None) -> Path:
 def write_comic(comic: Comic, *, path: Path | None = None) -> None:
     """Turns the Comic object into a set of resource configuration files."""
     path = _ensure_comic_has_path(comic, path)
-    _write_comic_config(comic, path=path)
-    _write_volumes(comic=comic, path=path)
+    _create_write_dirs(comic, path=path)
+    # one shared validation context for the whole write instead of a
+    # set/reset pair per serialized resource.
+    with models.set_context(path):
+        _write_comic_config(comic, path=path)
+        _write_volumes(comic)
+    comic.dirty = False
+
+
+def _create_write_dirs(comic: Comic, *, path: Path) -> None:
+    # batch up directory creation so the per-file writers can skip their
+    # own mkdir syscalls via ensure_parent=False.
+    dirs = {path}
+    for volume in comic.each_volume():
+        volume_dir = path / "volumes" / volume.slug
+        dirs.add(volume_dir)
+        pages_dir = volume.pages_dir if volume.path else volume_dir / "pages"
+        for page in volume.each_page():
+            dirs.add(pages_dir / page.slug)
+    for directory in dirs:
+        directory.mkdir(parents=True, exist_ok=True)
 
 
 def _write_comic_config(comic: Comic, *, path: Path) -> None:
@@ -170,60 +252,106 @@ def _write_comic_config(comic: Comic, *, path: Path) -> None:
             "Attempted to write virtual comic. This should never happen."
         )
 
-    with models.set_context(comic.path):
+    # a clean comic can reuse the model validated at read time.
+    if not comic.dirty and comic.model is not None:
+        config = comic.model
+    else:
         config = models.Comic(
-            path=comic.path,
             name=comic.name,
             placeholder=comic.placeholder,
             volumes=comic.volume_slugs,
         )
+        # keep the cached model in step with what lands on disk, so the
+        # clean-reuse branch above stays truthful on the next write.
+        comic.model = config
+
+    _try_write_toml(config_path, config.model_dump(), ensure_parent=False)
 
-    _try_write_toml(config_path, config.dict())
 
+_TomlWrite = tuple[Path, dict]
+
+
+def _write_volumes(comic: Comic) -> None:
+    # serialization stays single-threaded (pydantic validation relies on a
+    # contextvar), but the resulting file writes target distinct paths and
+    # can overlap on a thread pool.
+    writes: list[_TomlWrite] = []
+    for volume in comic.each_volume():
+        writes.extend(_serialize_volume(volume, comic=comic))
+
+    def write_one(write: _TomlWrite) -> None:
+        config_path, data = write
+        _try_write_toml(config_path, data, ensure_parent=False)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in executor.map(write_one, writes):
+            pass
 
-def _write_volumes(*, comic: Comic, path: Path) -> None:
     for volume in comic.each_volume():
-        _write_volume(volume, comic=comic, path=path)
+        volume.dirty = False
+        for page in volume.each_page():
+            page.dirty = False
+
 
+def _serialize_volume(volume: Volume, *, comic: Comic) -> list[_TomlWrite]:
+    writes = []
+
+    volume_write = _serialize_volume_config(volume, comic=comic)
+    if volume_write:
+        writes.append(volume_write)
 
-def _write_volume(volume: Volume, *, comic: Comic, path: Path) -> None:
-    _write_volume_config(volume, comic=comic, path=path)
     for page in volume.each_page():
-        _write_page(page, comic=comic)
+        page_write = _serialize_page(page, comic=comic)
+        if page_write:
+            writes.append(page_write)
+
+    return writes
 
 
-def _write_volume_config(volume: Volume, *, comic: Comic, path: Path) -> None:
+def _serialize_volume_config(volume: Volume, *, comic: Comic) -> Optional[_TomlWrite]:
     if not comic.path:
         raise ScuzzieError(
             "Attempted to write volume with a virtual comic. This should never happen."
         )
 
-    with models.set_context(comic.path):
+    path = comic.volumes_dir / volume.slug / "volume.toml"
+    if not volume.dirty and path.exists():
+        return None
+
+    if not volume.dirty and volume.model is not None:
+        config = volume.model
+    else:
         config = models.Volume(
             title=volume.title,
             image=volume.image,
             pages=volume.page_slugs,
         )
-    path = path / "volumes" / volume.slug / "volume.toml"
-    _try_write_toml(path, config.dict())
+        volume.model = config
+    return path, config.model_dump()
 
 
-def _write_page(page: Page, *, comic: Comic) -> None:
+def _serialize_page(page: Page, *, comic: Comic) -> Optional[_TomlWrite]:
     if not comic.path:
         raise ScuzzieError(
             "Attempted to write page with a virtual comic. This should never happen."
         )
 
     if page.volume and page.volume.path:
-        with models.set_context(comic.path):
+        path = page.volume.pages_dir / page.slug / "page.toml"
+        if not page.dirty and path.exists():
+            return None
+
+        if not page.dirty and page.model is not None:
+            config = page.model
+        else:
             config = models.Page(
                 title=page.title,
                 image=page.image,
             )
+            page.model = config
 
-        path = page.volume.path / "pages" / page.slug / "page.toml"
-        _try_write_toml(path, config.dict())
-    else:
-        raise ScuzzieVolumeConfigError(
-            "Tried to save page into null volume or volume with a null path."
-        )
+        return path, config.model_dump()
+
+    raise ScuzzieVolumeConfigError(
+        "Tried to save page into null volume or volume with a null path."
+    )
@@ -10,47 +10,52 @@ class ScuzzieError(Exception):
 
 
 class ScuzzieConfigError(ScuzzieError):
-    """Base class for errors related to config files."""
+    """
+    Base class for errors related to config files.
+
+    Don't raise this error type directly, use a subclass.
+    """
+
+    # the type of file that caused the error; set by subclasses as a
+    # plain class attribute to skip the descriptor protocol on raise.
+    file_type: str
 
     def __init__(self, reason: str) -> None:
         super().__init__(
             f"There is an issue with a {self.file_type} config file: {reason}"
         )
 
-    @property
-    def file_type(self) -> str:
-        """Returns the type of file that caused the error."""
-        raise NotImplementedError(
-            "Don't raise this error type directly, use a subclass."
-        )
-
 
 class ScuzzieComicConfigError(ScuzzieConfigError):
     """Raised when there is an issue with the comic config file."""
 
-    @property
-    def file_type(self) -> str:
-        return "comic"
+    file_type = "comic"
 
 
 class ScuzzieVolumeConfigError(ScuzzieConfigError):
     """Raised when there is an issue with a volume config file."""
 
-    @property
-    def file_type(self) -> str:
-        return "volume"
+    file_type = "volume"
 
 
 class ScuzziePageConfigError(ScuzzieConfigError):
     """Raised when there is an issue with a page config file."""
 
-    @property
-    def file_type(self) -> str:
-        return "page"
+    file_type = "page"
 
 
 class ScuzzieTemplateError(ScuzzieError):
-    """Base class for templating errors."""
+    """
+    Base class for templating errors.
+
+    Don't raise this error type directly, use a subclass.
+    """
+
+    # the type of template that caused the error; set by subclasses.
+    template_type: str
+    # the name of the resource that caused the error; set by subclasses
+    # before delegating to this initialiser.
+    resource_name: str
 
     def __init__(self, reason: str) -> None:
         super().__init__(
@@ -58,32 +63,13 @@ class ScuzzieTemplateError(ScuzzieError):
             f"for resource {self.resource_name}: {reason}"
         )
 
-    @property
-    def template_type(self) -> str:
-        """Returns the type of template that caused the error."""
-        raise NotImplementedError(
-            "Don't raise this error type directly, use a subclass."
-        )
-
-    @property
-    def resource_name(self) -> str:
-        """Returns the name of the resource that caused the error."""
-        raise NotImplementedError(
-            "Don't raise this error type directly, use a subclass."
-        )
-
 
 class ScuzziePageTemplateError(ScuzzieTemplateError):
     """Raised when there is an issue with a page template."""
 
+    template_type = "page"
+
     def __init__(self, page: "Page", *, reason: str) -> None:
         self.page = page
+        self.resource_name = page.title
         super().__init__(reason)
-
-    @property
-    def template_type(self) -> str:
-        return "page"
-
-    @property
-    def resource_name(self) -> str:
-        return self.page.title
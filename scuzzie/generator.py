@@ -1,15 +1,31 @@
 """
 The main generator module, provides tools for reading & writing site resources.
 """
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-
-from mako.lookup import TemplateLookup
-from mako.template import Template
+from typing import Optional
 
 from .exc import ScuzzieError, ScuzziePageTemplateError
 from .resources import Comic, Page, Volume
-from .templator import Templator
+from .templator import RenderContext, Templator
+
+# below this many pages, process startup costs more than it saves.
+PARALLEL_PAGE_THRESHOLD = 32
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    # hardlinking an asset into the site costs one directory entry
+    # instead of a full byte copy. os.link refuses to replace an existing
+    # file and cross-device links raise OSError, so fall back to a real
+    # copy when linking isn't possible.
+    try:
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
 class FileWriter:
@@ -20,32 +36,51 @@ class FileWriter:
     def __init__(self, *, path: Path, templator: Templator) -> None:
         self.path = path
         self.templator = templator
+        self._created_dirs: set[Path] = set()
 
-    def write_index_page(self, comic: Comic) -> None:
+    def write_index_page(
+        self, comic: Comic, *, context: Optional[RenderContext] = None
+    ) -> None:
         """Renders & writes the index page."""
         index_page_path = self.path / "index.html"
-        content = self.templator.render_index_page(comic)
+        content = self.templator.render_index_page(comic, context=context)
         self._write_content(index_page_path, content)
 
-    def write_about_page(self, comic: Comic) -> None:
+    def write_about_page(
+        self, comic: Comic, *, context: Optional[RenderContext] = None
+    ) -> None:
         """Renders & writes the about page."""
         about_page_path = self.path / "about.html"
-        content = self.templator.render_about(comic)
+        content = self.templator.render_about(comic, context=context)
         self._write_content(about_page_path, content)
 
-    def write_archive_page(self, comic: Comic) -> None:
+    def write_archive_page(
+        self, comic: Comic, *, context: Optional[RenderContext] = None
+    ) -> None:
         """Renders & writes the archive page."""
         archive_page_path = self.path / "archive.html"
-        content = self.templator.render_archive_page(comic)
+        content = self.templator.render_archive_page(comic, context=context)
         self._write_content(archive_page_path, content)
 
-    def write_volume(self, volume: Volume, *, comic: Comic) -> None:
+    def write_volume(
+        self,
+        volume: Volume,
+        *,
+        comic: Comic,
+        context: Optional[RenderContext] = None,
+    ) -> None:
         """Renders & writes a volume of pages."""
         volume_path = self.path / "volumes" / f"{volume.slug}.html"
-        content = self.templator.render_volume(volume, comic=comic)
+        content = self.templator.render_volume(volume, comic=comic, context=context)
         self._write_content(volume_path, content)
 
-    def write_page(self, page: Page, *, comic: Comic) -> None:
+    def write_page(
+        self,
+        page: Page,
+        *,
+        comic: Comic,
+        context: Optional[RenderContext] = None,
+    ) -> None:
         """Renders & writes a comic page."""
         if page.volume:
             page_path = (
@@ -55,22 +90,48 @@ class FileWriter:
             raise ScuzziePageTemplateError(
                 page, reason="Page has not been assigned to a volume."
             )
-        content = self.templator.render_page(page, comic=comic)
-        self._write_content(page_path, content)
+        # pages render straight into the output file; no intermediate
+        # string is built for what is the hottest render path. the render
+        # targets a temp file that only replaces the real page on success,
+        # so a template error can't leave a truncated page behind.
+        self._ensure_parent(page_path)
+        temp_path = page_path.with_name(f".{page_path.name}.tmp")
+        try:
+            with temp_path.open("w", encoding="utf-8", buffering=1 << 20) as file:
+                self.templator.render_page_to(
+                    page, comic=comic, file=file, context=context
+                )
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        temp_path.replace(page_path)
 
     def copy_assets(self, path: Path) -> None:
         """Copies static assets from the given path to the output path."""
-        shutil.copytree(path, self.path, dirs_exist_ok=True)
+        shutil.copytree(
+            path, self.path, dirs_exist_ok=True, copy_function=_link_or_copy
+        )
+
+    def _ensure_parent(self, path: Path) -> None:
+        # pages in the same volume share a parent, so remember which
+        # directories we've already created instead of re-stating them.
+        parent = path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
 
-    @staticmethod
-    def _write_content(path: Path, content: str) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w") as file:
-            file.write(content)
+    def _write_content(self, path: Path, content: str) -> None:
+        self._ensure_parent(path)
+        # one encode + one write syscall, skipping the text codec layer.
+        path.write_bytes(content.encode("utf-8"))
 
 
 def load_templates(comic: Comic) -> Templator:
     """Loads templates for the given comic."""
+    # mako is only needed once a build actually starts, so importing it
+    # here keeps `import scuzzie.generator` itself cheap.
+    from mako.lookup import TemplateLookup  # pylint: disable=import-outside-toplevel
+
     if comic.path is None:
         raise ScuzzieError(
             "Attempted to load templates for a virtual comic. "
@@ -78,22 +139,83 @@ def load_templates(comic: Comic) -> Templator:
         )
 
     templates_path = comic.path / "templates"
-    lookup = TemplateLookup(directories=[templates_path])
-
-    def load_template(name: str) -> Template:
-        template_path = templates_path / name
-        with template_path.open("r") as template_file:
-            return Template(template_file.read(), lookup=lookup)
+    # persisting compiled templates to disk lets warm builds skip mako's
+    # lex/parse/codegen phase; stale modules are still recompiled at load
+    # time, but filesystem_checks=False skips the per-render mtime stat.
+    lookup = TemplateLookup(
+        directories=[templates_path],
+        module_directory=str(comic.path / ".scuzzie_cache" / "mako"),
+        filesystem_checks=False,
+        collection_size=100,
+    )
 
     return Templator(
-        index_page_template=load_template("index.mako"),
-        about_page_template=load_template("about.mako"),
-        archive_page_template=load_template("archive.mako"),
-        volume_template=load_template("volume.mako"),
-        page_template=load_template("page.mako"),
+        index_page_template=lookup.get_template("index.mako"),
+        about_page_template=lookup.get_template("about.mako"),
+        archive_page_template=lookup.get_template("archive.mako"),
+        volume_template=lookup.get_template("volume.mako"),
+        page_template=lookup.get_template("page.mako"),
     )
 
 
+# per-worker state for parallel page rendering; mako templates don't
+# pickle, so each worker process loads the comic and templates itself.
+_worker_comic: Optional[Comic] = None
+_worker_writer: Optional[FileWriter] = None
+_worker_context: Optional[RenderContext] = None
+
+
+def _init_render_worker(comic_path: Path, site_path: Path) -> None:
+    # imported here to dodge a circular import at module load time.
+    from .comic import read_comic  # pylint: disable=import-outside-toplevel
+
+    global _worker_comic, _worker_writer, _worker_context  # pylint: disable=global-statement
+    _worker_comic = read_comic(comic_path)
+    templator = load_templates(_worker_comic)
+    _worker_writer = FileWriter(path=site_path, templator=templator)
+    _worker_context = templator.build_common_context(_worker_comic)
+
+
+def _render_page_in_worker(slugs: tuple[str, str]) -> None:
+    if _worker_comic is None or _worker_writer is None:
+        raise ScuzzieError("Render worker used before initialisation.")
+
+    volume_slug, page_slug = slugs
+    page = _worker_comic.volumes[volume_slug].pages[page_slug]
+    _worker_writer.write_page(page, comic=_worker_comic, context=_worker_context)
+
+
+def _write_pages(comic: Comic, writer: FileWriter, *, context: RenderContext) -> None:
+    page_tasks = [
+        (volume.slug, page.slug)
+        for volume in comic.each_volume()
+        for page in volume.each_page()
+    ]
+
+    if len(page_tasks) < PARALLEL_PAGE_THRESHOLD:
+        for volume in comic.each_volume():
+            for page in volume.each_page():
+                print(f"  Building page {page.title}")
+                writer.write_page(page, comic=comic, context=context)
+        return
+
+    if comic.path is None:
+        raise ScuzzieError("Attempted to write pages for a virtual comic.")
+
+    # page renders are independent and CPU-bound, so fan them out across
+    # worker processes; each write targets its own file so no locking is
+    # needed.
+    workers = os.cpu_count() or 1
+    print(f"Building {len(page_tasks)} pages on {workers} workers")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(comic.path, writer.path),
+    ) as executor:
+        for _ in executor.map(_render_page_in_worker, page_tasks, chunksize=16):
+            pass
+
+
 def generate_site(comic: Comic, writer: FileWriter) -> None:
     """
     Generates the site for the given comic and writes it using the given writer.
@@ -106,22 +228,23 @@ def generate_site(comic: Comic, writer: FileWriter) -> None:
 
     print(f"Building comic {comic.name}")
 
+    # the shared context is built once and reused by every render below.
+    context = writer.templator.build_common_context(comic)
+
     print("Building index page")
-    writer.write_index_page(comic)
+    writer.write_index_page(comic, context=context)
 
     print("Building about page")
-    writer.write_about_page(comic)
+    writer.write_about_page(comic, context=context)
 
     print("Building archive page")
-    writer.write_archive_page(comic)
+    writer.write_archive_page(comic, context=context)
 
     for volume in comic.each_volume():
         print(f"Building volume {volume.title}")
-        writer.write_volume(volume, comic=comic)
+        writer.write_volume(volume, comic=comic, context=context)
 
-        for page in volume.each_page():
-            print(f"  Building page {page.title}")
-            writer.write_page(page, comic=comic)
+    _write_pages(comic, writer, context=context)
 
     print("Copying static assets")
     writer.copy_assets(comic.path / "assets")
@@ -12,16 +12,19 @@ from scuzzie.generator import FileWriter, generate_site, load_templates
 
 def sanitise_image_path(image_path: Path, *, assets_path: Path) -> Path | None:
     """Sanitises the image path."""
-    image_path = image_path.absolute()
+    # resolve each path once; is_relative_to avoids materialising the
+    # whole parents sequence just to check containment.
+    image_path = image_path.resolve()
+    assets_path = assets_path.resolve()
 
-    if assets_path.absolute() not in image_path.parents:
+    if not image_path.is_relative_to(assets_path) or image_path == assets_path:
         gui.popup(
             "Image must be in the assets directory.",
             title="Error",
         )
         return None
 
-    return Path("/") / image_path.relative_to(assets_path.absolute())
+    return Path("/") / image_path.relative_to(assets_path)
 
 
 def build(*, comic_path: Path, site_path: Path) -> None:
@@ -41,13 +44,12 @@ def new_volume(comic_path: Path) -> None:
         )
 
     assets_path = comic.path / "assets"
-    placeholder = Path(str(comic.placeholder).strip("/"))
 
     layout = [
         [gui.Text("Title", size=6), gui.Input(key="title")],
         [
             gui.Text("Image", size=6),
-            gui.Input(assets_path / placeholder, key="image"),
+            gui.Input(comic.placeholder_asset_path, key="image"),
             gui.FileBrowse(key="image", initial_folder=assets_path),
         ],
         [gui.Push(), gui.Button("Cancel"), gui.Button("OK")],
@@ -95,7 +97,6 @@ def new_page(comic_path: Path) -> None:
         return
 
     assets_path = comic.path / "assets"
-    placeholder = Path(str(comic.placeholder).strip("/"))
 
     layout = [
         [
@@ -105,7 +106,7 @@ def new_page(comic_path: Path) -> None:
         [gui.Text("Title", size=6), gui.Input(key="title")],
         [
             gui.Text("Image", size=6),
-            gui.Input(assets_path / placeholder, key="image"),
+            gui.Input(comic.placeholder_asset_path, key="image"),
             gui.FileBrowse(key="image", initial_folder=assets_path),
         ],
         [gui.Push(), gui.Button("Cancel"), gui.Button("OK")],
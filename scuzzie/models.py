@@ -1,10 +1,13 @@
 """Pydantic model definitions."""
+import os
+import stat
 from contextlib import contextmanager
 from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
 from typing import Generator
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, field_validator
 
 validation_context: ContextVar[Path] = ContextVar("validation_context")
 
@@ -17,24 +20,43 @@ def set_context(comic_path: Path) -> Generator[None, None, None]:
     validation_context.reset(token)
 
 
-def validate_path_exists(path: Path) -> None:
-    """Raises a ValueError if the given path does not exist."""
-    if not path.exists():
-        raise ValueError(f"Path does not exist: {path}")
-
-
-def validate_path_is_file(path: Path) -> None:
-    """Raises a ValueError if the given path is not a file."""
-    if not path.is_file():
+@lru_cache(maxsize=None)
+def _asset_file_set(assets_dir: Path) -> frozenset[str]:
+    """Returns the relative paths of every file under the assets directory."""
+    # one walk of the assets tree replaces a stat syscall per page image.
+    files: set[str] = set()
+    for root, _dirs, names in os.walk(assets_dir):
+        relative_root = os.path.relpath(root, assets_dir)
+        prefix = "" if relative_root == "." else f"{relative_root}/"
+        files.update(f"{prefix}{name}" for name in names)
+    return frozenset(files)
+
+
+@lru_cache(maxsize=4096)
+def validate_path_is_existing_file(path: Path) -> None:
+    """Raises a ValueError unless the given path is an existing file."""
+    # one stat covers both the existence and regular-file checks, and the
+    # cache means repeat validations of the same asset (the placeholder,
+    # typically) cost nothing. failures aren't cached by lru_cache, so a
+    # missing file is re-checked every time.
+    try:
+        status = os.stat(path)
+    except OSError as ex:
+        raise ValueError(f"Path does not exist: {path}") from ex
+
+    if not stat.S_ISREG(status.st_mode):
         raise ValueError(f"Path is not a file: {path}")
 
 
 def validate_asset_exists(path: Path) -> None:
     """Raises a ValueError if the given path does not exist in the assets."""
     relative_path = str(path).strip("/")
-    path = validation_context.get() / "assets" / relative_path
-    validate_path_exists(path)
-    validate_path_is_file(path)
+    assets_dir = validation_context.get() / "assets"
+    if relative_path in _asset_file_set(assets_dir):
+        return
+    # the walk above is cached for the whole run, so fall back to a direct
+    # stat for assets dropped in afterwards (e.g. while the GUI is open).
+    validate_path_is_existing_file(assets_dir / relative_path)
 
 
 class Comic(BaseModel):
@@ -44,7 +66,7 @@ class Comic(BaseModel):
     placeholder: Path
     volumes: list[str]
 
-    @validator("placeholder")
+    @field_validator("placeholder")
     @classmethod
     def validate_placeholder(cls, v: Path) -> Path:
         """Ensure the placeholder path exists."""
@@ -59,7 +81,7 @@ class Volume(BaseModel):
     image: Path
     pages: list[str]
 
-    @validator("image")
+    @field_validator("image")
     @classmethod
     def validate_image(cls, v: Path) -> Path:
         """Ensure the image path exists."""
@@ -73,7 +95,7 @@ class Page(BaseModel):
     title: str
     image: Path
 
-    @validator("image")
+    @field_validator("image")
     @classmethod
     def validate_image(cls, v: Path) -> Path:
         """Ensure the image path exists."""
@@ -1,22 +1,65 @@
 """Defines the comic, volume, and page resources that make up a comic."""
+import re
+import sys
 from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 from slugify import slugify
 
 from scuzzie.exc import ScuzzieError
 
+if TYPE_CHECKING:
+    from scuzzie import models
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# titles that need python-slugify's html-unescape ("&amp;" -> "&") or
+# digit-comma handling ("1,000" -> "1000") to slug identically.
+_SLUG_SLOW_RE = re.compile(r"[&;]|\d,\d")
+
+
+@lru_cache(maxsize=4096)
+def _slugify(title: str) -> str:
+    """
+    Reduces a title to a url-safe slug.
+
+    Plain ascii titles take a cheap lowercase-and-substitute path that
+    produces the same slugs as python-slugify without its transliterate,
+    html-unescape, and number-grouping passes. Anything those passes
+    could affect goes through python-slugify proper, so every title
+    keeps the slug stored in configs written before the fast path.
+    """
+    if title.isascii() and not _SLUG_SLOW_RE.search(title):
+        return _SLUG_RE.sub("-", title.lower()).strip("-")
+    return slugify(title)
+
 
 class Page:
     """One page of a comic."""
 
-    def __init__(self, *, path: Optional[Path], title: str, image: Path) -> None:
+    # pages are by far the most numerous resource, so skip the per-instance
+    # __dict__ entirely. Volume and Comic keep theirs because their
+    # cached_property helpers need somewhere to store results.
+    __slots__ = ("path", "title", "slug", "image", "volume", "dirty", "model", "_url")
+
+    def __init__(
+        self,
+        *,
+        path: Optional[Path],
+        title: str,
+        image: Path,
+        model: Optional["models.Page"] = None,
+    ) -> None:
         self.path = path
         self.title = title
-        self.slug = slugify(title)
+        # interned so templates comparing or hashing slugs hit the
+        # string fast paths.
+        self.slug = sys.intern(_slugify(title))
         self.image = image
         self.volume: Optional[Volume] = None
+        self.dirty = False
+        self.model = model
+        self._url: Optional[str] = None
 
     def __str__(self) -> str:
         return self.title
@@ -27,23 +70,41 @@ class Page:
     @property
     def url(self) -> str:
         """Returns the URL of the page."""
-        if self.volume is None:
-            raise ScuzzieError("Attempt to get path URL but path is not in a volume.")
-        return f"/volumes/{self.volume.slug}/pages/{self.slug}.html"
+        # formatted once and cached; templates read this repeatedly.
+        if self._url is None:
+            if self.volume is None:
+                raise ScuzzieError(
+                    "Attempt to get path URL but path is not in a volume."
+                )
+            self._url = f"/volumes/{self.volume.slug}/pages/{self.slug}.html"
+        return self._url
 
 
 class Volume:
     """A volume is a collection of pages."""
 
     def __init__(
-        self, *, path: Optional[Path], title: str, image: Path, page_slugs: list[str]
+        self,
+        *,
+        path: Optional[Path],
+        title: str,
+        image: Path,
+        page_slugs: list[str],
+        model: Optional["models.Volume"] = None,
     ) -> None:
         self.path = path
         self.title = title
-        self.slug = slugify(title)
+        self.slug = sys.intern(_slugify(title))
         self.image = image
-        self.page_slugs = page_slugs
+        # interned to match page.slug, so the dict lookups in
+        # _ordered_pages hit the identity fast path.
+        self.page_slugs = [sys.intern(slug) for slug in page_slugs]
         self.pages: dict[str, Page] = {}
+        self.dirty = False
+        self.model = model
+        self._pages_cache: Optional[tuple[Page, ...]] = None
+        self._page_slug_set = set(page_slugs)
+        self._url: Optional[str] = None
 
     def __str__(self) -> str:
         return self.title
@@ -57,30 +118,42 @@ class Volume:
     @property
     def url(self) -> str:
         """Returns the URL of this volume."""
+        if self._url is None:
+            if self.path is None:
+                raise ScuzzieError("Attempt to get volume URL without a path.")
+            self._url = f"/volumes/{self.slug}.html"
+        return self._url
+
+    @cached_property
+    def pages_dir(self) -> Path:
+        """Returns the directory that holds this volume's pages."""
         if self.path is None:
-            raise ScuzzieError("Attempt to get volume URL without a path.")
-        return f"/volumes/{self.slug}.html"
+            raise ScuzzieError("Attempt to get the pages dir of a virtual volume.")
+        return self.path / "pages"
+
+    def _ordered_pages(self) -> tuple[Page, ...]:
+        # materialized lazily so repeated traversals skip the per-slug
+        # dict lookups; add_page invalidates the cache. tuples iterate
+        # faster than lists and can't be mutated behind our back.
+        if self._pages_cache is None:
+            self._pages_cache = tuple(self.pages[slug] for slug in self.page_slugs)
+        return self._pages_cache
 
     @property
     def first_page(self) -> Page | None:
         """Returns the first page in this volume, or none if the volume has no pages."""
-        if not self.page_slugs:
-            return None
-
-        return self.pages[self.page_slugs[0]]
+        pages = self._ordered_pages()
+        return pages[0] if pages else None
 
     @property
     def latest_page(self) -> Page | None:
         """Returns the latest page in this volume, or none if the volume has no pages."""
-        if not self.page_slugs:
-            return None
-
-        return self.pages[self.page_slugs[-1]]
+        pages = self._ordered_pages()
+        return pages[-1] if pages else None
 
     def each_page(self) -> Iterator[Page]:
         """Returns an iterator over all pages in this volume."""
-        for page_slug in self.page_slugs:
-            yield self.pages[page_slug]
+        return iter(self._ordered_pages())
 
     def add_page(self, page: Page) -> None:
         """Add a page to this volume."""
@@ -89,9 +162,14 @@ class Volume:
 
         page.volume = self
 
-        if page.slug not in self.page_slugs:
+        # set membership keeps bulk loads O(n) instead of O(n^2).
+        if page.slug not in self._page_slug_set:
             self.page_slugs.append(page.slug)
+            self._page_slug_set.add(page.slug)
+            # the page listing changed, so the cached model is stale.
+            self.dirty = True
         self.pages[page.slug] = page
+        self._pages_cache = None
 
 
 class Comic:
@@ -104,12 +182,17 @@ class Comic:
         name: str,
         placeholder: Path,
         volume_slugs: list[str],
+        model: Optional["models.Comic"] = None,
     ) -> None:
         self.path = path
         self.name = name
         self.placeholder = placeholder
-        self.volume_slugs = volume_slugs
+        self.volume_slugs = [sys.intern(slug) for slug in volume_slugs]
         self.volumes: dict[str, Volume] = {}
+        self.dirty = False
+        self.model = model
+        self._volumes_cache: Optional[tuple[Volume, ...]] = None
+        self._volume_slug_set = set(volume_slugs)
 
     def __str__(self) -> str:
         return self.name
@@ -120,21 +203,40 @@ class Comic:
             f"placeholder={self.placeholder}, volume_slugs={self.volume_slugs})"
         )
 
+    def _ordered_volumes(self) -> tuple[Volume, ...]:
+        if self._volumes_cache is None:
+            self._volumes_cache = tuple(
+                self.volumes[slug] for slug in self.volume_slugs
+            )
+        return self._volumes_cache
+
     @property
     def first_volume(self) -> Volume | None:
         """Returns the first volume in the comic, or none if the comic has no volumes."""
-        if not self.volume_slugs:
-            return None
-
-        return self.volumes[self.volume_slugs[0]]
+        volumes = self._ordered_volumes()
+        return volumes[0] if volumes else None
 
     @property
     def latest_volume(self) -> Volume | None:
         """Returns the latest volume in the comic, or none if the comic has no volumes."""
-        if not self.volume_slugs:
-            return None
+        volumes = self._ordered_volumes()
+        return volumes[-1] if volumes else None
+
+    @cached_property
+    def volumes_dir(self) -> Path:
+        """Returns the directory that holds this comic's volumes."""
+        if self.path is None:
+            raise ScuzzieError("Attempt to get the volumes dir of a virtual comic.")
+        return self.path / "volumes"
 
-        return self.volumes[self.volume_slugs[-1]]
+    @cached_property
+    def placeholder_asset_path(self) -> Path:
+        """Returns the on-disk path of the placeholder image."""
+        if self.path is None:
+            raise ScuzzieError(
+                "Attempt to get the placeholder path of a virtual comic."
+            )
+        return self.path / "assets" / str(self.placeholder).lstrip("/")
 
     @cached_property
     def all_pages(self) -> list[Page]:
@@ -161,22 +263,26 @@ class Comic:
 
     def each_volume(self) -> Iterator[Volume]:
         """Returns an iterator over all volumes in the comic."""
-        for volume_slug in self.volume_slugs:
-            yield self.volumes[volume_slug]
+        return iter(self._ordered_volumes())
 
     def add_volume(self, volume: Volume) -> None:
         """Add a volume to the comic."""
         if volume.slug in self.volumes:
             raise ScuzzieError(f"Volume {volume} already exists in {self}")
 
-        if volume.slug not in self.volume_slugs:
+        if volume.slug not in self._volume_slug_set:
             self.volume_slugs.append(volume.slug)
+            self._volume_slug_set.add(volume.slug)
+            self.dirty = True
         self.volumes[volume.slug] = volume
+        self._volumes_cache = None
 
     def create_volume(self, title: str, image: Path) -> Volume:
         """Create and add a new volume to the comic."""
         volume = Volume(path=None, title=title, image=image, page_slugs=[])
+        volume.dirty = True
         self.add_volume(volume)
+        self.dirty = True
         return volume
 
     def create_page(
@@ -188,5 +294,7 @@ class Comic:
             title=title,
             image=image if image is not None else self.placeholder,
         )
+        page.dirty = True
         volume.add_page(page)
+        volume.dirty = True
         return page
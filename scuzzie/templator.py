@@ -1,10 +1,19 @@
 """Defines the templator class."""
-from mako.template import Template
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
 
 from scuzzie.exc import ScuzzieError
 
 from .resources import Comic, Page, Volume
 
+if TYPE_CHECKING:
+    from typing import IO
+
+    from mako.template import Template
+
+RenderContext = dict[str, Any]
+
 
 class Templator:
     """Creates comic pages from templates."""
@@ -24,37 +33,102 @@ class Templator:
         self.volume_template = volume_template
         self.page_template = page_template
 
-    def render_index_page(self, comic: Comic) -> str:
+    @staticmethod
+    def build_common_context(comic: Comic) -> RenderContext:
+        """
+        Builds the render context shared by every template, so callers
+        rendering many pages can materialize it once instead of having
+        each template re-traverse the comic.
+        """
+        volumes = list(comic.each_volume())
+        return {
+            "comic": comic,
+            "volumes": volumes,
+            "pages_by_volume": {
+                volume.slug: list(volume.each_page()) for volume in volumes
+            },
+        }
+
+    def _context(
+        self, comic: Comic, context: Optional[RenderContext], **extra: Any
+    ) -> RenderContext:
+        if context is None:
+            context = self.build_common_context(comic)
+        return {**context, **extra}
+
+    def render_index_page(
+        self, comic: Comic, *, context: Optional[RenderContext] = None
+    ) -> str:
         """Renders the index page."""
         try:
-            return self.index_template.render(comic=comic)
+            return self.index_template.render(**self._context(comic, context))
         except Exception as ex:
             raise ScuzzieError(f"Error rendering index page: {ex}") from ex
 
-    def render_about(self, comic: Comic) -> str:
+    def render_about(
+        self, comic: Comic, *, context: Optional[RenderContext] = None
+    ) -> str:
         """Renders the about page."""
         try:
-            return self.about_template.render(comic=comic)
+            return self.about_template.render(**self._context(comic, context))
         except Exception as ex:
             raise ScuzzieError(f"Error rendering about page: {ex}") from ex
 
-    def render_archive_page(self, comic: Comic) -> str:
+    def render_archive_page(
+        self, comic: Comic, *, context: Optional[RenderContext] = None
+    ) -> str:
         """Renders the archive page."""
         try:
-            return self.archive_template.render(comic=comic)
+            return self.archive_template.render(**self._context(comic, context))
         except Exception as ex:
             raise ScuzzieError(f"Error rendering archive page: {ex}") from ex
 
-    def render_volume(self, volume: Volume, *, comic: Comic) -> str:
+    def render_volume(
+        self,
+        volume: Volume,
+        *,
+        comic: Comic,
+        context: Optional[RenderContext] = None,
+    ) -> str:
         """Renders a volume of pages."""
         try:
-            return self.volume_template.render(comic=comic, volume=volume)
+            return self.volume_template.render(
+                **self._context(comic, context, volume=volume)
+            )
         except Exception as ex:
             raise ScuzzieError(f"Error rendering volume {volume}: {ex}") from ex
 
-    def render_page(self, page: Page, *, comic: Comic) -> str:
+    def render_page(
+        self,
+        page: Page,
+        *,
+        comic: Comic,
+        context: Optional[RenderContext] = None,
+    ) -> str:
         """Renders a comic page."""
         try:
-            return self.page_template.render(comic=comic, page=page)
+            return self.page_template.render(**self._context(comic, context, page=page))
+        except Exception as ex:
+            raise ScuzzieError(f"Error rendering page {page}: {ex}") from ex
+
+    def render_page_to(
+        self,
+        page: Page,
+        *,
+        comic: Comic,
+        file: IO[str],
+        context: Optional[RenderContext] = None,
+    ) -> None:
+        """
+        Renders a comic page directly into the given file object,
+        skipping the intermediate string a regular render builds up.
+        """
+        # deferred for the same reason as in load_templates.
+        from mako.runtime import Context  # pylint: disable=import-outside-toplevel
+
+        try:
+            self.page_template.render_context(
+                Context(file, **self._context(comic, context, page=page))
+            )
         except Exception as ex:
             raise ScuzzieError(f"Error rendering page {page}: {ex}") from ex